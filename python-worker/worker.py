@@ -2,10 +2,16 @@
 import sys
 import os
 import json
+import re
 import time
 import subprocess
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # =====================================================
 #  IMPORT UPDATE MANAGER HELPERS
 # =====================================================
@@ -15,12 +21,34 @@ from worker_update import preview_update, request_update
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
+# =====================================================
+# IPC ENCODE/DECODE (orjson when available)
+# =====================================================
+def decode_message(line):
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def send_message(obj):
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        except TypeError:
+            # e.g. integers wider than 64 bits, which stdlib json handles
+            data = None
+    if data is None:
+        data = (json.dumps(obj) + "\n").encode("utf-8")
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
 # =====================================================
 # LOG HELPER (sends log messages to Electron UI)
 # =====================================================
 def log(msg):
-    sys.stdout.write(json.dumps({"log": str(msg)}) + "\n")
-    sys.stdout.flush()
+    send_message({"log": str(msg)})
 
 
 # =====================================================
@@ -49,6 +77,11 @@ def run_cmd(cmd, cwd=None, timeout=300):
 # =====================================================
 # PARSE FILE BLOCKS FROM TEXT
 # =====================================================
+_FILE_BLOCK_RE = re.compile(
+    r'(?:^|\n)([\w\-\./]+)\s*:\s*```[a-zA-Z0-9+\-]*\n([\s\S]*?)\n```'
+)
+
+
 def parse_text_for_files(text: str):
     """
     Extract blocks of the form:
@@ -57,14 +90,8 @@ def parse_text_for_files(text: str):
     content here
     ```
     """
-    import re
-
-    pattern = re.compile(
-        r'(?:^|\n)([\w\-\./]+)\s*:\s*```[a-zA-Z0-9+\-]*\n([\s\S]*?)\n```'
-    )
-
     files = []
-    for m in pattern.finditer(text):
+    for m in _FILE_BLOCK_RE.finditer(text):
         filename = m.group(1).strip()
         content = m.group(2)
         files.append({"filename": filename, "content": content})
@@ -83,9 +110,12 @@ def create_project_from_text(text):
     out_dir = BASE_DIR / f"project_{int(time.time())}"
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    seen_dirs = {out_dir}
     for f in files:
         path = out_dir / f["filename"]
-        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.parent not in seen_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            seen_dirs.add(path.parent)
         path.write_text(f["content"], encoding="utf-8")
 
     return {
@@ -207,7 +237,7 @@ def main():
             continue
 
         try:
-            obj = json.loads(line)
+            obj = decode_message(line)
         except:
             log("Invalid JSON received")
             continue
@@ -224,8 +254,7 @@ def main():
         if "__id" in obj:
             res["__id"] = obj["__id"]
 
-        sys.stdout.write(json.dumps(res) + "\n")
-        sys.stdout.flush()
+        send_message(res)
 
 
 if __name__ == "__main__":